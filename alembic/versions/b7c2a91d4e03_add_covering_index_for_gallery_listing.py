@@ -0,0 +1,37 @@
+"""add_covering_index_for_gallery_listing
+
+Revision ID: b7c2a91d4e03
+Revises: f1f353154647
+Create Date: 2026-08-29 10:14:22.481903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c2a91d4e03'
+down_revision: Union[str, None] = 'f1f353154647'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covering index for the gallery listing queries, which order by
+    # display_order and read every response column. INCLUDE puts the payload
+    # columns in the index leaf pages so PostgreSQL can satisfy the query
+    # with an index-only scan instead of visiting heap pages per row.
+    # (INCLUDE is PostgreSQL-specific; other dialects ignore the option.)
+    op.create_index(
+        'ix_gallery_images_display_order_covering',
+        'gallery_images',
+        ['display_order'],
+        unique=False,
+        postgresql_include=['id', 'cloudinary_url', 'caption', 'created_at', 'updated_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_gallery_images_display_order_covering', table_name='gallery_images')
@@ -38,6 +38,9 @@ class Settings(BaseSettings):
     CLOUDINARY_CLOUD_NAME: str = ""
     CLOUDINARY_API_KEY: str = ""
     CLOUDINARY_API_SECRET: str = ""
+    # Max in-flight Cloudinary requests per bulk operation; bounds both
+    # connection count and how many file buffers are held at once
+    CLOUDINARY_MAX_CONCURRENCY: int = 8
     
     # Admin Password (will be used in Epic 4)
     # Should be bcrypt hashed password
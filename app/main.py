@@ -2,32 +2,93 @@
 FastAPI application entry point.
 Main application instance with middleware and route configuration.
 """
-from fastapi import FastAPI, Request, status, Depends, HTTPException
+from fastapi import FastAPI, Request, Response, status, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
+import orjson
+from starlette.datastructures import Headers
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 import logging
+import queue
 import asyncio
+import time
 
 from app.config import settings
 from app.database import get_db, init_db, close_db
 from app.services.cloudinary_service import validate_cloudinary_config
 from app.routes import gallery, cms
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+# Configure logging through a queue so log calls on the request path never
+# block the event loop on stderr writes. Handlers enqueue records and return
+# immediately; a QueueListener thread (started in the lifespan) drains the
+# queue and writes to the stream in the background.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
+_log_listener = QueueListener(_log_queue, _stream_handler)
+
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(QueueHandler(_log_queue))
+
 logger = logging.getLogger(__name__)
 
+# Whether a database is configured; fixed for the process lifetime
+_DATABASE_CONFIGURED = bool(settings.DATABASE_URL)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: startup logic before yield, shutdown after.
+    Non-blocking: app will start even if database connection fails.
+    """
+    _log_listener.start()
+    logger.info(f"CORS allowed origins: {settings.CORS_ORIGINS}")
+
+    if _DATABASE_CONFIGURED:
+        try:
+            await init_db()
+            logger.info("Database connection established successfully")
+        except Exception as e:
+            logger.error(
+                f"Failed to initialize database on startup: {str(e)}\n"
+                f"The application will continue to run, but database-dependent endpoints will fail.\n"
+                f"Please check your DATABASE_URL configuration and network connectivity."
+            )
+            # Don't raise - allow app to start without database for non-db endpoints
+    else:
+        logger.info("DATABASE_URL not configured - database features will be unavailable")
+
+    yield
+
+    if _DATABASE_CONFIGURED:
+        try:
+            # Shield so connection cleanup completes even if shutdown is cancelled
+            await asyncio.shield(close_db())
+        except asyncio.CancelledError:
+            pass  # Shutdown cancelled; close_db continues in the background
+        except Exception as e:
+            logger.warning(f"Error during database shutdown: {str(e)}")
+
+    # Drain any queued records before the process exits
+    _log_listener.stop()
+
+
 # Create FastAPI application instance
 app = FastAPI(
     title=settings.API_TITLE,
     description=settings.API_DESCRIPTION,
     version=settings.API_VERSION,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS Middleware Configuration
@@ -40,68 +101,128 @@ app.add_middleware(
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
     allow_headers=["*"],  # Allow all headers including X-CMS-Password
     expose_headers=["*"],
-    max_age=3600,  # Cache preflight requests for 1 hour
+    max_age=7200,  # Cache preflight requests for 2 hours (Chromium's cap)
 )
 
-# Note: Custom CORS middleware removed as CORSMiddleware with allow_origins=["*"] handles all cases
+class _LazyHeaders:
+    """
+    Lazy wrapper around raw ASGI headers for logging.
+    Defers decoding/materializing the header list until a log handler
+    actually formats the record, so filtered-out log calls pay nothing.
+    """
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw):
+        self._raw = raw
+
+    def __repr__(self):
+        return repr([
+            (k.decode("latin-1"), v.decode("latin-1"))
+            for k, v in self._raw
+        ])
+
+    __str__ = __repr__
 
 
 # Request logging middleware for debugging
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log incoming requests for debugging, especially OPTIONS requests."""
-    method = request.method
-    path = request.url.path
-    origin = request.headers.get("origin", "No origin header")
-    access_control_request_method = request.headers.get("access-control-request-method", "N/A")
-    access_control_request_headers = request.headers.get("access-control-request-headers", "N/A")
-    
-    # Detailed logging for OPTIONS requests (CORS preflight)
-    if method == "OPTIONS":
-        logger.info(
-            f"OPTIONS preflight request to {path}\n"
-            f"  Origin: {origin}\n"
-            f"  Access-Control-Request-Method: {access_control_request_method}\n"
-            f"  Access-Control-Request-Headers: {access_control_request_headers}\n"
-            f"  All headers: {dict(request.headers)}"
-        )
-    else:
-        logger.debug(f"Incoming {method} request to {path} from origin: {origin}")
-    
-    try:
-        response = await call_next(request)
-        logger.info(f"Response status: {response.status_code} for {method} {path}")
-        
-        # Log CORS headers in response for OPTIONS
-        if method == "OPTIONS":
-            cors_headers = {
-                k: v for k, v in response.headers.items() 
-                if k.lower().startswith("access-control")
-            }
-            logger.info(f"CORS response headers: {cors_headers}")
-        
-        return response
-    except Exception as e:
-        logger.error(
-            f"Error processing {method} {path}: {str(e)}\n"
-            f"  Origin: {origin}\n"
-            f"  Error type: {type(e).__name__}",
-            exc_info=True
-        )
-        raise
+class LoggingASGIMiddleware:
+    """
+    Pure ASGI middleware that logs requests, especially OPTIONS requests.
 
-# Note: Explicit OPTIONS handlers removed - CORSMiddleware handles all preflight requests automatically
+    Implemented at the ASGI protocol level (instead of @app.middleware("http"))
+    to avoid the per-request task-group and stream wrapping overhead of
+    Starlette's BaseHTTPMiddleware on every endpoint.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        # Fast path: non-HTTP scopes, and requests where INFO (and therefore
+        # DEBUG) is suppressed, are forwarded untouched - no header parse and
+        # no send-wrapper closure allocation. Exceptions are still logged by
+        # the app-level exception handlers.
+        if scope["type"] != "http" or not logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        headers = Headers(scope=scope)
+        origin = headers.get("origin", "No origin header")
+
+        # Detailed logging for OPTIONS requests (CORS preflight)
+        if method == "OPTIONS" and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "OPTIONS preflight request to %s\n"
+                "  Origin: %s\n"
+                "  Access-Control-Request-Method: %s\n"
+                "  Access-Control-Request-Headers: %s\n"
+                "  All headers: %s",
+                path,
+                origin,
+                headers.get('access-control-request-method', 'N/A'),
+                headers.get('access-control-request-headers', 'N/A'),
+                _LazyHeaders(scope["headers"]),
+            )
+        else:
+            logger.debug("Incoming %s request to %s from origin: %s", method, path, origin)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                logger.info("Response status: %s for %s %s", message["status"], method, path)
+
+                # Log CORS headers in response for OPTIONS
+                # Scan the raw (bytes, bytes) header list directly - already
+                # lowercased by Starlette - and only when INFO will be emitted
+                if method == "OPTIONS" and logger.isEnabledFor(logging.INFO):
+                    cors_headers = [
+                        (k.decode("latin-1"), v.decode("latin-1"))
+                        for k, v in message["headers"]
+                        if k.startswith(b"access-control")
+                    ]
+                    logger.info("CORS response headers: %s", cors_headers)
+            await send(message)
 
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            logger.error(
+                "Error processing %s %s: %s\n"
+                "  Origin: %s\n"
+                "  Error type: %s",
+                method, path, e, origin, type(e).__name__,
+                exc_info=e
+            )
+            raise
 
-# Include routers (after OPTIONS handlers)
+
+app.add_middleware(LoggingASGIMiddleware)
+
+
+# Include routers
+# CORSMiddleware intercepts preflight OPTIONS requests before routing,
+# so no explicit OPTIONS handlers are registered.
 app.include_router(gallery.router, prefix="/api", tags=["gallery"])
 app.include_router(cms.router, prefix="/api", tags=["CMS"])
 
 
+# CORS headers for error responses, pre-encoded once at import time.
+# Since we use allow_origins=["*"], Access-Control-Allow-Origin is "*" for all responses.
+_CORS_ERROR_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"GET, POST, PUT, DELETE, OPTIONS, PATCH"),
+    (b"access-control-allow-headers", b"*"),
+    (b"access-control-expose-headers", b"*"),
+]
+
+
 def add_cors_headers(response: JSONResponse, request: Request) -> JSONResponse:
     """
     Add CORS headers to error responses.
-    Since we use allow_origins=["*"], we set Access-Control-Allow-Origin to "*" for all responses.
+    Extends the response's raw header list with precomputed bytes tuples
+    instead of building and re-encoding header strings per response.
 
     Args:
         response: The JSONResponse to add headers to
@@ -110,10 +231,7 @@ def add_cors_headers(response: JSONResponse, request: Request) -> JSONResponse:
     Returns:
         JSONResponse with CORS headers added
     """
-    response.headers["Access-Control-Allow-Origin"] = "*"
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS, PATCH"
-    response.headers["Access-Control-Allow-Headers"] = "*"
-    response.headers["Access-Control-Expose-Headers"] = "*"
+    response.raw_headers.extend(_CORS_ERROR_HEADERS)
 
     return response
 
@@ -123,10 +241,15 @@ def add_cors_headers(response: JSONResponse, request: Request) -> JSONResponse:
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions (401, 403, 404, etc.) with CORS headers."""
     logger.error(
-        f"HTTPException on {request.method} {request.url.path}:\n"
-        f"  Status: {exc.status_code}\n"
-        f"  Origin: {request.headers.get('origin', 'No origin')}\n"
-        f"  Detail: {exc.detail}"
+        "HTTPException on %s %s:\n"
+        "  Status: %s\n"
+        "  Origin: %s\n"
+        "  Detail: %s",
+        request.method,
+        request.url.path,
+        exc.status_code,
+        request.headers.get('origin', 'No origin'),
+        exc.detail,
     )
     
     # Handle both string and dict detail formats
@@ -148,12 +271,18 @@ async def validation_exception_handler(
     request: Request, exc: RequestValidationError
 ):
     """Handle request validation errors."""
-    logger.error(
-        f"Validation error on {request.method} {request.url.path}:\n"
-        f"  Origin: {request.headers.get('origin', 'No origin')}\n"
-        f"  Headers: {dict(request.headers)}\n"
-        f"  Errors: {exc.errors()}"
-    )
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "Validation error on %s %s:\n"
+            "  Origin: %s\n"
+            "  Headers: %s\n"
+            "  Errors: %s",
+            request.method,
+            request.url.path,
+            request.headers.get('origin', 'No origin'),
+            _LazyHeaders(request.headers.raw),
+            exc.errors(),
+        )
     response = JSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
         content={
@@ -164,16 +293,46 @@ async def validation_exception_handler(
     return add_cors_headers(response, request)
 
 
+@app.exception_handler(SQLAlchemyError)
+async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
+    """Handle database errors with a structured 500 that leaks no internals."""
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "Database error on %s %s:\n"
+            "  Origin: %s\n"
+            "  Error type: %s",
+            request.method,
+            request.url.path,
+            request.headers.get('origin', 'No origin'),
+            type(exc).__name__,
+            exc_info=exc
+        )
+    response = JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={
+            "error": "Database error",
+            "detail": "A database error occurred"
+        }
+    )
+    return add_cors_headers(response, request)
+
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions."""
-    logger.error(
-        f"Unhandled exception on {request.method} {request.url.path}:\n"
-        f"  Origin: {request.headers.get('origin', 'No origin')}\n"
-        f"  Error: {str(exc)}\n"
-        f"  Error type: {type(exc).__name__}",
-        exc_info=True
-    )
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "Unhandled exception on %s %s:\n"
+            "  Origin: %s\n"
+            "  Error: %s\n"
+            "  Error type: %s",
+            request.method,
+            request.url.path,
+            request.headers.get('origin', 'No origin'),
+            exc,
+            type(exc).__name__,
+            exc_info=exc
+        )
     response = JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
@@ -185,20 +344,37 @@ async def general_exception_handler(request: Request, exc: Exception):
 
 
 # Root Endpoints
+# The root body is immutable after startup, so serialize it once at import
+_ROOT_BODY = orjson.dumps({
+    "message": settings.API_TITLE,
+    "status": "healthy",
+    "version": settings.API_VERSION
+})
+
+
 @app.get("/")
 async def root():
     """Root endpoint - API health check."""
-    return {
-        "message": settings.API_TITLE,
-        "status": "healthy",
-        "version": settings.API_VERSION
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
+
+
+# /health is hit constantly by load balancers; serialize its fixed body once
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return Response(_HEALTH_BODY, media_type="application/json")
+
+
+# /health/db probe cache: orchestrators poll this at 1-5s intervals, and each
+# SELECT 1 consumes a pooled connection that could be serving traffic. Serve a
+# recent cached result instead, and collapse concurrent pollers into a single
+# query with a lock.
+_DB_HEALTH_TTL = 2.0
+_db_health = {"response": None, "ts": 0.0}
+_db_health_lock = asyncio.Lock()
 
 
 @app.get("/health/db")
@@ -206,21 +382,34 @@ async def health_check_db(db: AsyncSession = Depends(get_db)):
     """
     Database health check endpoint.
     Tests database connection and returns status.
+    Results are cached briefly so frequent polling doesn't tie up the pool.
     """
-    try:
-        result = await db.execute(text("SELECT 1"))
-        return {
-            "database": "connected",
-            "status": "healthy",
-            "result": result.scalar()
-        }
-    except Exception as e:
-        logger.error(f"Database health check failed: {str(e)}", exc_info=True)
-        return {
-            "database": "error",
-            "status": "unhealthy",
-            "error": "Database connection failed"
-        }
+    if time.monotonic() - _db_health["ts"] < _DB_HEALTH_TTL and _db_health["response"] is not None:
+        return _db_health["response"]
+
+    async with _db_health_lock:
+        # Another poller may have refreshed the cache while we waited
+        if time.monotonic() - _db_health["ts"] < _DB_HEALTH_TTL and _db_health["response"] is not None:
+            return _db_health["response"]
+
+        try:
+            result = await db.execute(text("SELECT 1"))
+            response = {
+                "database": "connected",
+                "status": "healthy",
+                "result": result.scalar()
+            }
+        except Exception as e:
+            logger.error("Database health check failed: %s", e, exc_info=e)
+            response = {
+                "database": "error",
+                "status": "unhealthy",
+                "error": "Database connection failed"
+            }
+
+        _db_health["response"] = response
+        _db_health["ts"] = time.monotonic()
+        return response
 
 
 @app.get("/health/cloudinary")
@@ -244,7 +433,7 @@ async def health_check_cloudinary():
                 "message": "Cloudinary credentials not set in environment variables"
             }
     except Exception as e:
-        logger.error(f"Cloudinary health check failed: {str(e)}", exc_info=True)
+        logger.error("Cloudinary health check failed: %s", e, exc_info=e)
         return {
             "cloudinary": "error",
             "status": "unhealthy",
@@ -252,37 +441,4 @@ async def health_check_cloudinary():
         }
 
 
-@app.on_event("startup")
-async def startup_event():
-    """
-    Initialize database connection on application startup.
-    Non-blocking: app will start even if database connection fails.
-    """
-    logger.info(f"CORS allowed origins: {settings.CORS_ORIGINS}")
-    
-    if settings.DATABASE_URL:
-        try:
-            await init_db()
-            logger.info("Database connection established successfully")
-        except Exception as e:
-            logger.error(
-                f"Failed to initialize database on startup: {str(e)}\n"
-                f"The application will continue to run, but database-dependent endpoints will fail.\n"
-                f"Please check your DATABASE_URL configuration and network connectivity."
-            )
-            # Don't raise - allow app to start without database for non-db endpoints
-    else:
-        logger.info("DATABASE_URL not configured - database features will be unavailable")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Close database connections on application shutdown."""
-    if settings.DATABASE_URL:
-        try:
-            await close_db()
-        except Exception as e:
-            # Ignore cancellation errors during shutdown - they're expected
-            if not isinstance(e, (KeyboardInterrupt, asyncio.CancelledError)):
-                logger.warning(f"Error during database shutdown: {str(e)}")
 
@@ -2,28 +2,36 @@
 CMS API routes with password authentication.
 All endpoints require password authentication via header.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Header, UploadFile, File, Form, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Header, UploadFile, File, Form, Query, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, insert, update, delete
 from sqlalchemy.sql import func
-from typing import Optional, List
+from typing import Optional
 import logging
 import re
 import asyncio
 
+from app.config import settings
 from app.database import get_db
 from app.models import GalleryImage
+from pydantic import TypeAdapter
+
 from app.schemas import GalleryImageResponse, GalleryImageUpdate, BulkDeleteRequest, ImageReorderRequest
 from app.utils.auth import verify_admin_password
 from app.utils.image_converter import convert_to_webp
-from app.services.cloudinary_service import upload_image, delete_image
+from app.services.cloudinary_service import upload_image, delete_image, bulk_delete_images, BULK_DELETE_BATCH_SIZE
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/cms", tags=["CMS"])
+router = APIRouter(prefix="/cms", tags=["CMS"], default_response_class=ORJSONResponse)
+
+# Validates a whole list of ORM rows in one pydantic-core call instead of a
+# per-row Python loop of model_validate
+_GALLERY_LIST_ADAPTER = TypeAdapter(list[GalleryImageResponse])
 
 
-def verify_cms_password(
+async def verify_cms_password(
     x_cms_password: Optional[str] = Header(None, alias="X-CMS-Password", description="CMS admin password")
 ) -> bool:
     """
@@ -38,28 +46,44 @@ def verify_cms_password(
     Raises:
         HTTPException: 401 if password is invalid or missing
     """
-    if not x_cms_password:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={"error": "Missing password", "message": "CMS access requires password authentication"}
-        )
-    
     try:
-        if not verify_admin_password(x_cms_password):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail={"error": "Invalid password", "message": "CMS access denied"}
-            )
+        # Always run the full verification path, even for a missing header —
+        # short-circuiting on absence would reveal presence vs. wrongness
+        # through differential timing. bcrypt itself is ~100ms of pure CPU,
+        # so it runs in a worker thread to keep the event loop free.
+        valid = await asyncio.to_thread(verify_admin_password, x_cms_password or "")
     except ValueError as e:
         # ADMIN_PASSWORD_HASH not configured
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error": "Authentication not configured", "message": str(e)}
         )
-    
+
+    if not valid:
+        if not x_cms_password:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail={"error": "Missing password", "message": "CMS access requires password authentication"}
+            )
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={"error": "Invalid password", "message": "CMS access denied"}
+        )
+
     return True
 
 
+# Compiled once at import time; extract_public_id_from_url is on the hot path
+# of bulk deletes, so avoid the re-cache lookup on every call.
+# Matches: /image/upload/ followed by optional transformation segments
+# (short key_value pairs such as f_auto,q_auto — stored URLs carry these
+# since delivery options are baked in at write time), an optional
+# /v{version}/, then the public_id (which may include folders), capturing
+# everything until the end of the URL. Folder names never match the
+# transformation shape because they contain no underscore-keyed prefix.
+_PUBLIC_ID_RE = re.compile(r'/image/upload(?:/[a-z]{1,3}_[^/]+)*(?:/v\d+)?/(.+)$')
+
+
 def extract_public_id_from_url(cloudinary_url: str) -> str:
     """
     Extract Cloudinary public_id from URL.
@@ -78,77 +102,94 @@ def extract_public_id_from_url(cloudinary_url: str) -> str:
     Raises:
         ValueError: If URL format is invalid
     """
-    # Pattern to match Cloudinary URL structure
-    # Matches: /image/upload/v{version}/ or /image/upload/ followed by public_id (which may include folders)
-    # Captures everything after /image/upload/ (or /image/upload/v{version}/) until the end
-    pattern = r'/image/upload(?:/v\d+)?/(.+)$'
-    match = re.search(pattern, cloudinary_url)
-    
+    match = _PUBLIC_ID_RE.search(cloudinary_url)
+
     if not match:
         raise ValueError(f"Invalid Cloudinary URL format: {cloudinary_url}")
-    
+
+    # Strip the file extension from the last segment (public_id should not
+    # include the extension). Example: "gallery/image.jpg" -> "gallery/image"
+    # A dot only counts as an extension separator if it comes after the last
+    # slash, i.e. it lives in the filename segment.
     public_id_with_ext = match.group(1)
-    
-    # Remove file extension from the last segment (public_id should not include extension)
-    # Example: "gallery/image.jpg" -> "gallery/image"
-    # Example: "image.jpg" -> "image"
-    # Handle both folder paths and direct filenames
-    if '.' in public_id_with_ext:
-        # Split by '/' to handle folder paths
-        parts = public_id_with_ext.split('/')
-        # Remove extension from the last part (filename)
-        if len(parts) > 0:
-            last_part = parts[-1]
-            if '.' in last_part:
-                # Remove extension from filename
-                parts[-1] = last_part.rsplit('.', 1)[0]
-                return '/'.join(parts)
-    
+    dot = public_id_with_ext.rfind('.')
+    if dot > public_id_with_ext.rfind('/'):
+        return public_id_with_ext[:dot]
     return public_id_with_ext
 
 
-@router.get("/gallery-images", response_model=list[GalleryImageResponse])
+@router.get("/gallery-images")
 async def get_cms_gallery_images(
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of images per page"),
+    after_id: Optional[int] = Query(None, description="Return images after this image ID (keyset cursor)"),
     db: AsyncSession = Depends(get_db),
     authenticated: bool = Depends(verify_cms_password)
 ):
     """
-    Get all gallery images for CMS dashboard.
+    Get gallery images for CMS dashboard, one page at a time.
     Requires password authentication.
     
-    Returns gallery images ordered by creation date (newest first).
+    Returns gallery images ordered by display_order. Pagination is
+    keyset-based: pass the "next_cursor" from one page as "after_id" to
+    fetch the next, which stays O(page) on the display_order index instead
+    of the O(offset) scan that LIMIT/OFFSET would pay on large galleries.
     
     Args:
+        limit: Maximum number of images per page (default 50)
+        after_id: ID of the last image on the previous page, if any
         db: Database session (injected by FastAPI dependency)
         authenticated: Authentication status (injected by dependency)
     
     Returns:
-        list[GalleryImageResponse]: List of gallery images with metadata
+        dict: {"items": [...], "next_cursor": <id or null>}
     
     Raises:
         HTTPException: 500 if database query fails
     """
-    try:
-        # Query all gallery images, ordered by display_order ascending (custom order)
-        result = await db.execute(
-            select(GalleryImage).order_by(GalleryImage.display_order.asc())
-        )
-        images = result.scalars().all()
-        
-        logger.info(f"Retrieved {len(images)} gallery images for CMS")
-        
-        # Convert SQLAlchemy models to Pydantic schemas
-        return [GalleryImageResponse.model_validate(img) for img in images]
-        
-    except Exception as e:
-        logger.error(f"Error fetching CMS gallery images: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": "Failed to retrieve gallery images", "detail": str(e)}
+    # Query only the response columns, ordered by display_order ascending
+    # (custom order). Selecting columns instead of the mapped entity skips
+    # ORM instance construction and lets PostgreSQL answer from the
+    # covering index without touching heap pages.
+    stmt = select(
+        GalleryImage.id,
+        GalleryImage.cloudinary_url,
+        GalleryImage.caption,
+        GalleryImage.display_order,
+        GalleryImage.created_at,
+        GalleryImage.updated_at,
+    ).order_by(GalleryImage.display_order.asc()).limit(limit)
+    
+    if after_id is not None:
+        # Resolve the cursor row's display_order in the same statement;
+        # everything after it in display order is the next page
+        after_order = (
+            select(GalleryImage.display_order)
+            .where(GalleryImage.id == after_id)
+            .scalar_subquery()
         )
-
-
-@router.post("/gallery-images", response_model=List[GalleryImageResponse], status_code=status.HTTP_201_CREATED)
+        stmt = stmt.where(GalleryImage.display_order > after_order)
+    
+    result = await db.execute(stmt)
+    images = result.mappings().all()
+    
+    logger.info(f"Retrieved {len(images)} gallery images for CMS")
+    
+    # A short page means we ran out of rows; otherwise hand back the last
+    # ID so the client can ask for the page after it
+    next_cursor = images[-1]["id"] if len(images) == limit else None
+    
+    # Validate the rows in one pydantic-core call and serialize with orjson,
+    # skipping FastAPI's jsonable_encoder pass entirely
+    return ORJSONResponse({
+        "items": _GALLERY_LIST_ADAPTER.dump_python(
+            _GALLERY_LIST_ADAPTER.validate_python(images, from_attributes=True),
+            mode="json"
+        ),
+        "next_cursor": next_cursor
+    })
+
+
+@router.post("/gallery-images", status_code=status.HTTP_201_CREATED)
 async def add_cms_gallery_images(
     request: Request,
     db: AsyncSession = Depends(get_db),
@@ -165,159 +206,270 @@ async def add_cms_gallery_images(
         authenticated: Authentication status (injected by dependency)
     
     Returns:
-        List[GalleryImageResponse]: Created images with metadata
+        dict: Per-file results — "created" holds the stored images with
+        metadata, "failed" holds {filename, error} entries. The response is
+        201 when everything succeeded and 207 (Multi-Status) on partial
+        success, so clients can retry only the files that failed.
     
     Raises:
         HTTPException: 400 if files are invalid, 500 if upload or save fails
     """
-    try:
-        # Parse multipart form data
-        form = await request.form()
-        
-        # Get all files (they all have the same field name "files")
-        files = form.getlist("files")
-        
-        if not files or len(files) == 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={"error": "No files provided", "detail": "At least one image file is required"}
-            )
-        
-        # Get captions if provided
-        caption_list = []
-        captions = form.getlist("captions")
-        if captions:
-            caption_list = [c if isinstance(c, str) else str(c) for c in captions]
-        
-        # Validate all files first
-        for i, file in enumerate(files):
-            if not hasattr(file, 'content_type') or not file.content_type or not file.content_type.startswith('image/'):
-                filename = getattr(file, 'filename', f'file_{i}')
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={"error": "Invalid file type", "detail": f"File '{filename}' is not a valid image file"}
-                )
-        
-        # Step 1: Upload all files to Cloudinary concurrently (no database operations)
-        upload_tasks = []
-        for i, file in enumerate(files):
-            # Get caption for this file (if provided)
-            caption = None
-            if caption_list and i < len(caption_list):
-                caption = caption_list[i]
-            elif caption_list and len(caption_list) == 1:
-                # If only one caption provided, apply to all files
-                caption = caption_list[0]
-
-            # Create upload task (only Cloudinary upload, no DB operations)
-            task = _upload_to_cloudinary(file, caption)
-            upload_tasks.append(task)
-
-        # Execute all Cloudinary uploads concurrently
-        upload_results = await asyncio.gather(*upload_tasks, return_exceptions=True)
-
-        # Process upload results
-        successful_uploads = []
-        errors = []
-
-        for i, result in enumerate(upload_results):
-            if isinstance(result, Exception):
-                error_msg = str(result)
-                filename = getattr(files[i], 'filename', f'file_{i}')
-                logger.error(f"Error uploading file {filename} to Cloudinary: {error_msg}")
-                errors.append({
-                    "filename": filename,
-                    "error": error_msg
-                })
-            else:
-                successful_uploads.append(result)
-
-        # If all uploads failed, return error
-        if len(successful_uploads) == 0:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={
-                    "error": "All uploads failed",
-                    "errors": errors
-                }
-            )
+    # Parse multipart form data
+    form = await request.form()
+    
+    # Get all files (they all have the same field name "files")
+    files = form.getlist("files")
+    
+    if not files or len(files) == 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "No files provided", "detail": "At least one image file is required"}
+        )
+    
+    # Get captions if provided
+    caption_list = []
+    captions = form.getlist("captions")
+    if captions:
+        caption_list = [c if isinstance(c, str) else str(c) for c in captions]
+    
+    # Validate all files first: a single generator scan that short-circuits
+    # at the first offender (getattr also covers plain form values that
+    # arrive under the files field and have no content_type at all)
+    bad = next(
+        (
+            (i, file) for i, file in enumerate(files)
+            if not (getattr(file, 'content_type', None) or '').startswith('image/')
+        ),
+        None
+    )
+    if bad is not None:
+        i, file = bad
+        filename = getattr(file, 'filename', f'file_{i}')
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "Invalid file type", "detail": f"File '{filename}' is not a valid image file"}
+        )
+    
+    # Step 1: Stream each file through read -> convert -> upload in its own
+    # task. Draining a file's spool buffer and pushing it to Cloudinary
+    # happens per file rather than in whole-batch phases, so file N+1 is
+    # being read while file N is already in flight and each file's bytes
+    # are released as soon as its upload finishes — peak memory is bounded
+    # by the files currently in flight, not the whole batch.
+    # Bound Cloudinary concurrency so a large batch does not open dozens of
+    # HTTPS connections at once; the semaphore also caps how many file
+    # buffers are held in memory simultaneously
+    semaphore = asyncio.Semaphore(settings.CLOUDINARY_MAX_CONCURRENCY)
+
+    errors = []
+    upload_tasks = []
+    upload_filenames = []
+    for i, file in enumerate(files):
+        filename = getattr(file, 'filename', f'file_{i}')
+
+        # Get caption for this file (if provided)
+        caption = None
+        if caption_list and i < len(caption_list):
+            caption = caption_list[i]
+        elif caption_list and len(caption_list) == 1:
+            # If only one caption provided, apply to all files
+            caption = caption_list[0]
+
+        upload_tasks.append(_read_and_upload(file, filename, caption, semaphore))
+        upload_filenames.append(filename)
+
+    # Step 2: Execute all read+upload pipelines concurrently
+    upload_results = await asyncio.gather(*upload_tasks, return_exceptions=True)
+
+    # Classify results with comprehensions (inlined appends) rather than an
+    # explicit loop; one pass per outcome over the zipped pairs
+    upload_errors = [
+        {"filename": filename, "error": str(result)}
+        for filename, result in zip(upload_filenames, upload_results)
+        if isinstance(result, Exception)
+    ]
+    if upload_errors:
+        logger.error(f"Cloudinary upload failures: {upload_errors}")
+    errors.extend(upload_errors)
+
+    successful_uploads = [
+        result for result in upload_results if not isinstance(result, Exception)
+    ]
+
+    # If all uploads failed, return error
+    if len(successful_uploads) == 0:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": "All uploads failed",
+                "errors": errors
+            }
+        )
 
-        # Step 2: Save all successful uploads to database SEQUENTIALLY to avoid session conflicts
-        # Get the current maximum display_order ONCE before the loop to avoid multiple queries
+    # Step 3: Save all successful uploads in one explicit transaction;
+    # commit on exit and rollback on exception are handled by the block
+    async with db.begin():
+        if db.bind.dialect.name == "postgresql":
+            # Transaction-scoped advisory lock serializes concurrent batch
+            # appends: released at commit, so the next writer reads its
+            # max_order after this batch's rows are visible. Without it two
+            # uploads can read the same high-water mark, hand out colliding
+            # display_orders, and the COPY path's select-back would return
+            # the other request's rows.
+            await db.execute(select(func.pg_advisory_xact_lock(_GALLERY_APPEND_LOCK)))
+
+        # Get the current maximum display_order ONCE to avoid multiple queries
         max_order_result = await db.execute(
             select(func.max(GalleryImage.display_order))
         )
         max_order = max_order_result.scalar() or 0
 
-        created_images = []
-        for idx, upload_data in enumerate(successful_uploads):
-            try:
-                # Create database record with incremented display_order
-                new_image = GalleryImage(
-                    cloudinary_url=upload_data["url"],
-                    caption=upload_data["caption"],
-                    display_order=max_order + idx + 1
-                )
-                db.add(new_image)
-
-                created_images.append(new_image)
-                logger.info(f"Added image to session: {upload_data.get('filename', 'unknown')}, display_order={max_order + idx + 1}")
-
-            except Exception as e:
-                logger.error(f"Error adding image to database session: {str(e)}")
-                errors.append({
-                    "filename": upload_data.get("filename", "unknown"),
-                    "error": f"Database save failed: {str(e)}"
-                })
-        
-        # If all uploads failed, rollback and return error
-        if len(created_images) == 0:
-            await db.rollback()
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={
-                    "error": "All uploads failed",
-                    "errors": errors
-                }
+        rows = [
+            {
+                "cloudinary_url": upload_data["url"],
+                "caption": upload_data["caption"],
+                "display_order": max_order + idx + 1,
+            }
+            for idx, upload_data in enumerate(successful_uploads)
+        ]
+
+        if len(rows) >= _COPY_THRESHOLD and db.bind.dialect.driver == "asyncpg":
+            # Very large imports go through PostgreSQL COPY, which beats
+            # even multi-row INSERT once batches reach the hundreds
+            created_images = await _copy_gallery_rows(db, rows, max_order)
+        else:
+            # One bulk INSERT returns all rows with server-generated columns
+            # (id, timestamps), replacing per-row flush/refresh round-trips
+            result = await db.execute(
+                insert(GalleryImage).returning(GalleryImage),
+                rows
             )
+            created_images = result.scalars().all()
+    
+    # Log partial success if some failed
+    if len(errors) > 0:
+        logger.warning(f"Partial upload success: {len(created_images)} succeeded, {len(errors)} failed")
+    
+    logger.info(f"Successfully uploaded {len(created_images)} image(s)")
+    
+    # 207 Multi-Status on partial success gives clients a per-file verdict,
+    # so a retry re-uploads only the failed files instead of the whole batch
+    return ORJSONResponse(
+        status_code=status.HTTP_207_MULTI_STATUS if errors else status.HTTP_201_CREATED,
+        content={
+            "created": _GALLERY_LIST_ADAPTER.dump_python(
+                _GALLERY_LIST_ADAPTER.validate_python(created_images, from_attributes=True),
+                mode="json"
+            ),
+            "failed": errors
+        }
+    )
+
+
+# Batches at or above this size are inserted via PostgreSQL COPY instead of
+# a multi-row INSERT; COPY does one permission/type check for the whole
+# stream and stays ahead of INSERT as batches grow
+_COPY_THRESHOLD = 100
+
+# Arbitrary-but-fixed key for the pg_advisory_xact_lock guarding gallery
+# batch appends (display_order high-water-mark read + insert)
+_GALLERY_APPEND_LOCK = 0x6761_6c6c  # "gall"
 
-        # Flush to get IDs for all images, then commit
-        await db.flush()
-
-        # Refresh all images to get final state with IDs
-        for img in created_images:
-            await db.refresh(img)
-            logger.info(f"Successfully saved image to database: ID {img.id}, display_order={img.display_order}")
-
-        # Commit all successful uploads at once
-        await db.commit()
-        
-        # Log partial success if some failed
-        if len(errors) > 0:
-            logger.warning(f"Partial upload success: {len(created_images)} succeeded, {len(errors)} failed")
-        
-        logger.info(f"Successfully uploaded {len(created_images)} image(s)")
-        
-        return [GalleryImageResponse.model_validate(img) for img in created_images]
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error adding gallery images: {str(e)}", exc_info=True)
-        await db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": "Failed to add gallery images", "detail": str(e)}
-        )
 
+async def _copy_gallery_rows(db: AsyncSession, rows: list, max_order: int) -> list:
+    """
+    Bulk-load gallery rows with asyncpg's native COPY support.
+    COPY cannot RETURN the inserted rows, so they are selected back by the
+    display_order range assigned by the caller (all within one transaction).
+    The caller's advisory lock makes that range exclusively this batch's:
+    no concurrent upload can commit rows above max_order before we do.
+
+    Args:
+        db: Database session (already holding the transaction)
+        rows: Row dicts with cloudinary_url, caption, and display_order keys
+        max_order: display_order high-water mark before this batch
 
-async def _upload_to_cloudinary(file: UploadFile, caption: Optional[str]) -> dict:
+    Returns:
+        list[GalleryImage]: The inserted rows with server-generated columns
+    """
+    conn = await db.connection()
+    raw_conn = await conn.get_raw_connection()
+    await raw_conn.driver_connection.copy_records_to_table(
+        GalleryImage.__tablename__,
+        records=[
+            (row["cloudinary_url"], row["caption"], row["display_order"])
+            for row in rows
+        ],
+        columns=["cloudinary_url", "caption", "display_order"]
+    )
+
+    result = await db.execute(
+        select(GalleryImage)
+        .where(GalleryImage.display_order > max_order)
+        .order_by(GalleryImage.display_order.asc())
+    )
+    return result.scalars().all()
+
+
+
+
+async def _read_and_upload(
+    file: UploadFile,
+    filename: str,
+    caption: Optional[str],
+    semaphore: asyncio.Semaphore
+) -> dict:
+    """
+    Read one uploaded file's bytes and push them to Cloudinary, gated by
+    the caller's semaphore. Running read and upload inside the same task
+    lets the batch overlap ingress and egress across files, and drops each
+    file's bytes as soon as its upload completes.
+
+    Args:
+        file: Uploaded file (Starlette UploadFile or spooled equivalent)
+        filename: Original filename (for logging and error reporting)
+        caption: Optional caption for the image
+        semaphore: Bounds how many pipelines run concurrently
+
+    Returns:
+        dict: Upload data containing url, caption, and filename
+
+    Raises:
+        Exception: If reading or uploading fails
+    """
+    async with semaphore:
+        # Hand the spooled temp file straight to the convert/upload path;
+        # Pillow and Cloudinary both stream from file objects, so the image
+        # is never duplicated as an in-memory bytes copy
+        return await _upload_to_cloudinary(file.file, filename, caption)
+
+
+# Below this size a WebP re-encode rarely wins enough bytes to justify the
+# CPU of a Pillow decode+encode pass, so small files upload as-is
+_WEBP_SKIP_THRESHOLD = 50 * 1024
+
+
+def _source_size(source) -> int:
+    """Byte length of an upload source (bytes or a seekable file object)."""
+    if isinstance(source, (bytes, bytearray)):
+        return len(source)
+    source.seek(0, 2)
+    size = source.tell()
+    source.seek(0)
+    return size
+
+
+async def _upload_to_cloudinary(file_source, filename: str, caption: Optional[str]) -> dict:
     """
     Upload a single image to Cloudinary (no database operations).
-    This function can be run concurrently with other uploads.
+    This function can be run concurrently with other uploads. file_source
+    may be raw bytes or a seekable file object (the upload's spooled temp
+    file); file objects are streamed through conversion and upload without
+    being copied into memory.
 
     Args:
-        file: Image file to upload
+        file_source: Image bytes or seekable binary file object to upload
+        filename: Original filename (for logging and error reporting)
         caption: Optional caption for the image
 
     Returns:
@@ -327,34 +479,42 @@ async def _upload_to_cloudinary(file: UploadFile, caption: Optional[str]) -> dic
         Exception: If upload fails
     """
     try:
-        # Read file content
-        file_content = await file.read()
-        filename = getattr(file, 'filename', 'unknown')
-
-        # Convert to WebP format to reduce file size before upload
-        converted_content, conversion_success = await convert_to_webp(
-            file_content,
-            quality=85,
-            skip_if_webp=True
-        )
+        # Convert to WebP format to reduce file size before upload; files
+        # under the threshold skip conversion (and the Pillow decode) entirely
+        if _source_size(file_source) < _WEBP_SKIP_THRESHOLD:
+            logger.debug(f"Skipping WebP conversion for small file {filename}")
+            converted_content, conversion_success = file_source, True
+        else:
+            converted_content, conversion_success = await convert_to_webp(
+                file_source,
+                quality=85,
+                skip_if_webp=True
+            )
 
         if conversion_success:
-            original_size = len(file_content)
-            converted_size = len(converted_content)
-            if converted_size < original_size:
-                logger.info(
-                    f"Converted {filename} to WebP: "
-                    f"{original_size:,} bytes → {converted_size:,} bytes"
-                )
-                file_content = converted_content
-            else:
-                logger.debug(f"WebP conversion did not reduce size for {filename}, using original")
+            if converted_content is not file_source:
+                original_size = _source_size(file_source)
+                converted_size = len(converted_content)
+                if converted_size < original_size:
+                    logger.info(
+                        f"Converted {filename} to WebP: "
+                        f"{original_size:,} bytes → {converted_size:,} bytes"
+                    )
+                    file_source = converted_content
+                else:
+                    logger.debug(f"WebP conversion did not reduce size for {filename}, using original")
+                    # Drop the losing conversion now rather than holding it
+                    # across the upload await point; under concurrent 20MB
+                    # uploads that copy would otherwise sit live while the
+                    # coroutine is parked
+                    del converted_content
+            # else: already WebP, upload the original source as-is
         else:
             logger.warning(f"WebP conversion failed for {filename}, uploading original format")
 
         # Upload to Cloudinary
         logger.info(f"Uploading image to Cloudinary: {filename}")
-        cloudinary_result = await upload_image(file_content, folder="gallery")
+        cloudinary_result = await upload_image(file_source, folder="gallery")
         cloudinary_url = cloudinary_result["url"]
 
         logger.info(f"Successfully uploaded to Cloudinary: {cloudinary_url}")
@@ -366,7 +526,7 @@ async def _upload_to_cloudinary(file: UploadFile, caption: Optional[str]) -> dic
         }
 
     except Exception as e:
-        logger.error(f"Error uploading {file.filename} to Cloudinary: {str(e)}")
+        logger.error(f"Error uploading {filename} to Cloudinary: {str(e)}")
         raise
 
 
@@ -394,84 +554,80 @@ async def reorder_gallery_images(
     Raises:
         HTTPException: 400 if invalid IDs, 404 if images not found, 500 if update fails
     """
-    try:
-        image_ids = request.image_ids
-
-        if not image_ids or len(image_ids) == 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={"error": "No image IDs provided", "detail": "At least one image ID is required"}
-            )
-
-        # Verify all images exist
-        result = await db.execute(
-            select(GalleryImage).where(GalleryImage.id.in_(image_ids))
-        )
-        existing_images = result.scalars().all()
-        existing_ids = {img.id for img in existing_images}
-
-        # Check for missing IDs
-        missing_ids = set(image_ids) - existing_ids
-        if missing_ids:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "error": "Images not found",
-                    "detail": f"Image IDs not found: {list(missing_ids)}"
-                }
-            )
+    image_ids = request.image_ids
 
-        # Get ALL images to handle reordering properly
-        # If only a subset is provided, we need to adjust all images
-        all_images_result = await db.execute(
-            select(GalleryImage).order_by(GalleryImage.display_order.asc())
+    if not image_ids or len(image_ids) == 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "No image IDs provided", "detail": "At least one image ID is required"}
         )
-        all_images = all_images_result.scalars().all()
-        all_image_ids = {img.id for img in all_images}
-        
-        # Create a set of IDs that are being reordered
-        reordered_ids = set(image_ids)
-        
-        # Build the final ordered list:
-        # 1. Reordered images in the order provided
-        # 2. Remaining images in their current relative order
-        final_ordered_ids = []
-        final_ordered_ids.extend(image_ids)  # Add reordered images first
-        
-        # Add remaining images that weren't in the reorder request
-        # Maintain their current relative order
-        for img in all_images:
-            if img.id not in reordered_ids:
-                final_ordered_ids.append(img.id)
-
-        # Update display_order for ALL images to ensure no conflicts
-        # This prevents gaps or overlapping display_order values
-        for position, image_id in enumerate(final_ordered_ids):
-            await db.execute(
-                update(GalleryImage)
-                .where(GalleryImage.id == image_id)
-                .values(display_order=position)
-            )
 
-        await db.commit()
+    async with db.begin():
+        return await _reorder_in_transaction(db, image_ids)
 
-        logger.info(f"Successfully reordered {len(image_ids)} images")
 
-        return {
-            "message": f"Successfully reordered {len(image_ids)} images",
-            "count": len(image_ids)
-        }
+async def _reorder_in_transaction(db: AsyncSession, image_ids: list) -> dict:
+    """Apply a reorder inside the caller's transaction block."""
+    # Verify all images exist — only IDs are needed, so select the scalar
+    # column instead of hydrating full ORM rows
+    result = await db.execute(
+        select(GalleryImage.id).where(GalleryImage.id.in_(image_ids))
+    )
+    existing_ids = set(result.scalars().all())
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error reordering gallery images: {str(e)}", exc_info=True)
-        await db.rollback()
+    # Check for missing IDs
+    missing_ids = set(image_ids) - existing_ids
+    if missing_ids:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": "Failed to reorder gallery images", "detail": str(e)}
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "Images not found",
+                "detail": f"Image IDs not found: {list(missing_ids)}"
+            }
         )
 
+    # Get ALL image IDs and their current display_order to handle
+    # reordering properly; if only a subset is provided, we need to adjust
+    # all images
+    all_ordered_result = await db.execute(
+        select(GalleryImage.id, GalleryImage.display_order)
+        .order_by(GalleryImage.display_order.asc())
+    )
+    ordered_rows = all_ordered_result.all()
+    all_ordered_ids = [row.id for row in ordered_rows]
+    current_order = {row.id: row.display_order for row in ordered_rows}
+
+    # Create a set of IDs that are being reordered
+    reordered_ids = set(image_ids)
+
+    # Build the final ordered list:
+    # 1. Reordered images in the order provided
+    # 2. Remaining images in their current relative order
+    final_ordered_ids = list(image_ids)
+    final_ordered_ids.extend(
+        image_id for image_id in all_ordered_ids if image_id not in reordered_ids
+    )
+
+    # Update only rows whose display_order actually changes (prevents gaps
+    # or overlapping values without rewriting the whole table — moving one
+    # image touches a handful of rows, not all of them). SQLAlchemy's
+    # bulk-UPDATE-by-primary-key form sends every parameter set in one
+    # executemany round-trip instead of one statement per image.
+    changed = [
+        {"id": image_id, "display_order": position}
+        for position, image_id in enumerate(final_ordered_ids)
+        if current_order.get(image_id) != position
+    ]
+    if changed:
+        await db.execute(update(GalleryImage), changed)
+
+    logger.info(f"Successfully reordered {len(image_ids)} images")
+
+    return {
+        "message": f"Successfully reordered {len(image_ids)} images",
+        "count": len(image_ids)
+    }
+
 
 @router.put("/gallery-images/{image_id}", response_model=GalleryImageResponse)
 async def update_cms_gallery_image(
@@ -496,43 +652,78 @@ async def update_cms_gallery_image(
     Raises:
         HTTPException: 404 if image not found, 500 if update fails
     """
-    try:
-        # Query image by ID
+    # Update and fetch the row in a single statement via RETURNING,
+    # saving the separate SELECT round-trip. The begin() block commits on
+    # exit and rolls back if the 404 is raised.
+    caption = image_update.caption
+    async with db.begin():
         result = await db.execute(
-            select(GalleryImage).where(GalleryImage.id == image_id)
+            update(GalleryImage)
+            .where(GalleryImage.id == image_id)
+            .values(caption=caption.strip() if caption and caption.strip() else None)
+            .returning(GalleryImage)
         )
         image = result.scalar_one_or_none()
-        
+
         if not image:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"error": "Image not found", "detail": f"Image ID {image_id} does not exist"}
             )
-        
-        # Update caption
-        caption = image_update.caption
-        image.caption = caption.strip() if caption and caption.strip() else None
-        await db.commit()
-        await db.refresh(image)
-        
-        logger.info(f"Successfully updated image caption: ID {image_id}")
-        
-        return GalleryImageResponse.model_validate(image)
-        
-    except HTTPException:
-        raise
+
+    logger.info(f"Successfully updated image caption: ID {image_id}")
+
+    return GalleryImageResponse.model_validate(image)
+
+
+async def _cleanup_cloudinary_assets(public_ids: list) -> None:
+    """
+    Delete a set of Cloudinary assets, batched through the bulk Admin API.
+    Runs as a background task after the DB delete has committed, so failures
+    are logged rather than raised — nothing upstream is waiting on them.
+
+    Args:
+        public_ids: Cloudinary public IDs to delete
+    """
+    batches = [
+        public_ids[i:i + BULK_DELETE_BATCH_SIZE]
+        for i in range(0, len(public_ids), BULK_DELETE_BATCH_SIZE)
+    ]
+    semaphore = asyncio.Semaphore(settings.CLOUDINARY_MAX_CONCURRENCY)
+
+    async def bounded_delete(batch: list) -> dict:
+        async with semaphore:
+            return await bulk_delete_images(batch)
+
+    results = await asyncio.gather(
+        *(bounded_delete(batch) for batch in batches),
+        return_exceptions=True
+    )
+
+    for batch, result in zip(batches, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Cloudinary bulk deletion failed for {len(batch)} image(s): {str(result)}")
+
+
+async def _cleanup_cloudinary_asset(public_id: str) -> None:
+    """
+    Delete a single Cloudinary asset. Background-task counterpart of
+    delete_image: failures are logged, never raised.
+
+    Args:
+        public_id: Cloudinary public ID to delete
+    """
+    try:
+        result = await delete_image(public_id)
+        logger.info(f"Successfully deleted from Cloudinary: {public_id}, result: {result}")
     except Exception as e:
-        logger.error(f"Error updating gallery image: {str(e)}", exc_info=True)
-        await db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": "Failed to update gallery image", "detail": str(e)}
-        )
+        logger.error(f"Failed to delete from Cloudinary (public_id: {public_id}): {str(e)}", exc_info=True)
 
 
 @router.delete("/gallery-images/bulk")
 async def delete_cms_gallery_images_bulk(
     request: BulkDeleteRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     authenticated: bool = Depends(verify_cms_password)
 ):
@@ -552,129 +743,61 @@ async def delete_cms_gallery_images_bulk(
     Raises:
         HTTPException: 400 if no IDs provided, 500 if deletion fails
     """
-    try:
-        image_ids = request.image_ids
-        
-        if not image_ids or len(image_ids) == 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={"error": "No image IDs provided", "detail": "At least one image ID is required"}
-            )
-        
-        # Get all images from database
+    image_ids = request.image_ids
+    
+    if not image_ids or len(image_ids) == 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "No image IDs provided", "detail": "At least one image ID is required"}
+        )
+    
+    # Delete the rows and fetch the Cloudinary URLs in a single
+    # DELETE ... RETURNING round-trip, replacing the old SELECT-then-DELETE
+    # pair. The begin() block commits on exit and rolls back when the 404
+    # is raised.
+    async with db.begin():
         result = await db.execute(
-            select(GalleryImage).where(GalleryImage.id.in_(image_ids))
+            delete(GalleryImage)
+            .where(GalleryImage.id.in_(image_ids))
+            .returning(GalleryImage.id, GalleryImage.cloudinary_url)
         )
-        images = result.scalars().all()
-        
-        if not images:
+        rows = result.all()
+
+        if not rows:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"error": "No images found", "detail": f"None of the provided image IDs were found"}
             )
-        
-        # Step 1: Delete from Cloudinary concurrently (no DB operations)
-        cloudinary_delete_tasks = []
-        for image in images:
-            task = _delete_from_cloudinary(image)
-            cloudinary_delete_tasks.append(task)
-
-        # Execute all Cloudinary deletions concurrently
-        cloudinary_results = await asyncio.gather(*cloudinary_delete_tasks, return_exceptions=True)
-
-        # Track Cloudinary deletion errors (but continue with DB deletion)
-        errors = []
-        for i, result in enumerate(cloudinary_results):
-            if isinstance(result, Exception):
-                logger.warning(f"Cloudinary deletion failed for image {images[i].id}: {str(result)}")
-                # Don't add to errors list - we'll still try to delete from DB
-
-        # Step 2: Delete from database sequentially to avoid session conflicts
-        deleted_ids = []
-        for image in images:
-            try:
-                await db.delete(image)
-                deleted_ids.append(image.id)
-                logger.info(f"Marked image for deletion from database: ID {image.id}")
-            except Exception as e:
-                error_msg = str(e)
-                logger.error(f"Error deleting image {image.id} from database: {error_msg}")
-                errors.append({
-                    "image_id": image.id,
-                    "error": error_msg
-                })
-        
-        # If all deletions failed, rollback and return error
-        if len(deleted_ids) == 0:
-            await db.rollback()
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={
-                    "error": "All deletions failed",
-                    "errors": errors
-                }
-            )
-        
-        # Commit all successful deletions at once
-        await db.commit()
-        
-        # Log partial success if some failed
-        if len(errors) > 0:
-            logger.warning(f"Partial deletion success: {len(deleted_ids)} succeeded, {len(errors)} failed")
-        
-        logger.info(f"Successfully deleted {len(deleted_ids)} image(s)")
-        
-        return {
-            "message": f"Deleted {len(deleted_ids)} image(s) successfully",
-            "deleted_ids": deleted_ids,
-            "errors": errors if errors else None
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting gallery images: {str(e)}", exc_info=True)
-        await db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": "Failed to delete gallery images", "detail": str(e)}
-        )
-
 
-async def _delete_from_cloudinary(image: GalleryImage) -> None:
-    """
-    Delete a single image from Cloudinary (no database operations).
-    This function can be run concurrently with other Cloudinary deletions.
-
-    Args:
-        image: GalleryImage model containing cloudinary_url
+    deleted_ids = [row.id for row in rows]
 
-    Raises:
-        Exception: If Cloudinary deletion fails
-    """
-    try:
-        # Extract Cloudinary public_id from URL
-        cloudinary_public_id = None
+    # Cloudinary cleanup is housekeeping once the commit has happened — the
+    # images are already gone from the CMS — so it runs as a background task
+    # after the response is sent. The client gets its acknowledgment at
+    # DB-commit time instead of waiting out the Cloudinary round-trips.
+    public_ids = []
+    for row in rows:
         try:
-            cloudinary_public_id = extract_public_id_from_url(image.cloudinary_url)
-            logger.info(f"Extracted public_id: {cloudinary_public_id} from URL: {image.cloudinary_url}")
+            public_ids.append(extract_public_id_from_url(row.cloudinary_url))
         except ValueError as e:
             logger.warning(f"Failed to extract public_id from URL: {str(e)}")
-            return  # Skip Cloudinary deletion if we can't extract public_id
 
-        # Delete from Cloudinary
-        if cloudinary_public_id:
-            result = await delete_image(cloudinary_public_id)
-            logger.info(f"Successfully deleted from Cloudinary: {cloudinary_public_id}, result: {result}")
+    if public_ids:
+        background_tasks.add_task(_cleanup_cloudinary_assets, public_ids)
 
-    except Exception as e:
-        logger.error(f"Failed to delete from Cloudinary for image ID {image.id}: {str(e)}", exc_info=True)
-        raise
+    logger.info(f"Successfully deleted {len(deleted_ids)} image(s)")
+
+    return {
+        "message": f"Deleted {len(deleted_ids)} image(s) successfully",
+        "deleted_ids": deleted_ids,
+        "errors": None
+    }
 
 
 @router.delete("/gallery-images/{image_id}")
 async def delete_cms_gallery_image(
     image_id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     authenticated: bool = Depends(verify_cms_password)
 ):
@@ -694,55 +817,40 @@ async def delete_cms_gallery_image(
     Raises:
         HTTPException: 404 if image not found, 500 if deletion fails
     """
-    try:
-        # Get image from database
+    # The begin() block commits on exit and rolls back when the 404 is
+    # raised, replacing the manual commit/rollback pair
+    async with db.begin():
+        # Delete from the database and fetch the Cloudinary URL in a single
+        # statement via RETURNING, saving the separate SELECT round-trip
         result = await db.execute(
-            select(GalleryImage).where(GalleryImage.id == image_id)
+            delete(GalleryImage)
+            .where(GalleryImage.id == image_id)
+            .returning(GalleryImage.cloudinary_url)
         )
-        image = result.scalar_one_or_none()
-        
-        if not image:
+        cloudinary_url = result.scalar_one_or_none()
+
+        if cloudinary_url is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={"error": "Image not found", "detail": f"Image ID {image_id} does not exist"}
             )
-        
-        # Extract Cloudinary public_id from URL
-        try:
-            cloudinary_public_id = extract_public_id_from_url(image.cloudinary_url)
-            logger.info(f"Extracted public_id: {cloudinary_public_id} from URL: {image.cloudinary_url}")
-        except ValueError as e:
-            logger.warning(f"Failed to extract public_id from URL: {str(e)}")
-            cloudinary_public_id = None
-        
-        # Delete from Cloudinary (if public_id was extracted)
-        if cloudinary_public_id:
-            try:
-                result = await delete_image(cloudinary_public_id)
-                logger.info(f"Successfully deleted from Cloudinary: {cloudinary_public_id}, result: {result}")
-            except Exception as e:
-                logger.error(f"Failed to delete from Cloudinary for image ID {image_id} (public_id: {cloudinary_public_id}): {str(e)}", exc_info=True)
-                # Continue with database deletion even if Cloudinary deletion fails
-                # But log the error for debugging
-        else:
-            logger.warning(f"Could not extract public_id from URL: {image.cloudinary_url}, skipping Cloudinary deletion for image ID {image_id}")
-        
-        # Delete from database
-        await db.execute(
-            delete(GalleryImage).where(GalleryImage.id == image_id)
-        )
-        await db.commit()
-        
-        logger.info(f"Successfully deleted image from database: ID {image_id}")
-        
-        return {"message": "Image deleted successfully", "image_id": image_id}
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting gallery image: {str(e)}", exc_info=True)
-        await db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={"error": "Failed to delete gallery image", "detail": str(e)}
-        )
+
+    # Extract Cloudinary public_id from URL
+    try:
+        cloudinary_public_id = extract_public_id_from_url(cloudinary_url)
+        logger.info(f"Extracted public_id: {cloudinary_public_id} from URL: {cloudinary_url}")
+    except ValueError as e:
+        logger.warning(f"Failed to extract public_id from URL: {str(e)}")
+        cloudinary_public_id = None
+
+    # Cloudinary cleanup happens after the response: the row is already
+    # committed away, so the client doesn't wait out the ~200-500 ms
+    # Cloudinary round-trip for what is pure housekeeping
+    if cloudinary_public_id:
+        background_tasks.add_task(_cleanup_cloudinary_asset, cloudinary_public_id)
+    else:
+        logger.warning(f"Could not extract public_id from URL: {cloudinary_url}, skipping Cloudinary deletion for image ID {image_id}")
+    
+    logger.info(f"Successfully deleted image from database: ID {image_id}")
+    
+    return {"message": "Image deleted successfully", "image_id": image_id}
@@ -2,24 +2,41 @@
 Gallery routes for public gallery image retrieval.
 Provides endpoints for fetching gallery images to display in the frontend.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, lambda_stmt
 from typing import List, Optional
+from datetime import timezone
+from email.utils import format_datetime
+import hashlib
 import logging
 
+import orjson
+
 from app.database import get_db
 from app.models import GalleryImage
-from app.schemas import GalleryImageResponse, GalleryImagesPageResponse, GalleryImagePublicResponse, PaginationMetadata
+from app.schemas import GalleryImagesPageResponse
 
 logger = logging.getLogger(__name__)
 
 # Create router instance
 router = APIRouter()
 
+# Serialized page bodies keyed by (etag, limit, cursor). The ETag probe runs
+# on every request anyway, so a hit here is guaranteed fresh — a CMS write
+# changes updated_at, which changes the etag and misses the cache. No
+# explicit invalidation hook or TTL is needed; entries from superseded
+# gallery versions are pruned when a new version's page is stored.
+# Bounded: cursor is client-supplied on an unauthenticated endpoint, so
+# without a cap arbitrary (limit, cursor) probes could grow the cache
+# without limit inside one gallery version.
+_PAGE_CACHE_MAX = 32
+_page_cache: dict = {}
+
 
 @router.get("/gallery-images", response_model=GalleryImagesPageResponse)
 async def get_gallery_images(
+    request: Request,
     limit: int = 12,
     cursor: Optional[int] = None,
     db: AsyncSession = Depends(get_db)
@@ -30,7 +47,12 @@ async def get_gallery_images(
     Implements cursor-based pagination using display_order field.
     Returns images ordered by display_order ascending.
 
+    Supports HTTP conditional GET: responses carry an ETag derived from
+    the gallery's latest update, and a matching If-None-Match header gets
+    an empty 304 without running the listing query or serializing a page.
+
     Args:
+        request: Incoming request (read for the If-None-Match header)
         limit: Number of images to return (default: 12, max: 100)
         cursor: Last display_order from previous page (for pagination)
         db: Database session (injected by FastAPI dependency)
@@ -41,60 +63,111 @@ async def get_gallery_images(
     Raises:
         HTTPException: 400 if invalid parameters, 500 if database query fails
     """
-    try:
-        # Validate limit
-        if limit < 1 or limit > 100:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Limit must be between 1 and 100"
-            )
-
-        # Build query with cursor-based pagination
-        query = select(GalleryImage).order_by(GalleryImage.display_order.asc())
-
-        if cursor is not None:
-            # Get images after the cursor
-            query = query.where(GalleryImage.display_order > cursor)
-
-        # Fetch limit + 1 to determine if there are more results
-        query = query.limit(limit + 1)
-        result = await db.execute(query)
-        images = result.scalars().all()
-
-        # Check if there are more results
-        has_more = len(images) > limit
-        if has_more:
-            images = images[:limit]  # Remove the extra record
-
-        # Determine next cursor
-        next_cursor = images[-1].display_order if images and has_more else None
-
-        # Get total count
-        count_result = await db.execute(select(func.count(GalleryImage.id)))
-        total_count = count_result.scalar()
-
-        logger.info(
-            f"Retrieved {len(images)} gallery images "
-            f"(cursor: {cursor}, next: {next_cursor}, has_more: {has_more})"
+    # Validate limit
+    if limit < 1 or limit > 100:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Limit must be between 1 and 100"
         )
 
-        return GalleryImagesPageResponse(
-            images=[GalleryImagePublicResponse.model_validate(img) for img in images],
-            pagination=PaginationMetadata(
-                next_cursor=next_cursor,
-                has_more=has_more,
-                total_count=total_count
-            )
+    # One cheap probe captures the collection state: the gallery only
+    # changes through CMS writes, so (max updated_at, row count)
+    # identifies a version of every page. The count doubles as the
+    # pagination total, replacing the separate COUNT query.
+    probe = (await db.execute(
+        select(func.max(GalleryImage.updated_at), func.count(GalleryImage.id))
+    )).one()
+    max_updated, total_count = probe
+
+    # RFC 9110 entity-tags are quoted strings; an unquoted token works
+    # against browsers (they echo it verbatim) but a conforming proxy or
+    # CDN normalizing If-None-Match would never match it
+    digest = hashlib.blake2b(
+        f"{max_updated}:{total_count}".encode(), digest_size=8
+    ).hexdigest()
+    etag = f'"{digest}"'
+    cache_headers = {"ETag": etag}
+    if max_updated is not None:
+        # Timestamps are stored naive in UTC; format_datetime needs the
+        # tzinfo attached to emit the RFC 1123 GMT form
+        cache_headers["Last-Modified"] = format_datetime(
+            max_updated.replace(tzinfo=timezone.utc), usegmt=True
         )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to retrieve gallery images: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "Failed to retrieve gallery images",
-                "detail": str(e)
-            }
-        )
+    # Unchanged collection means every page is unchanged — skip the
+    # listing query and serialization entirely
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    # Clients without a validator still skip the listing query if this
+    # process served the same page for the current gallery version
+    cache_key = (etag, limit, cursor)
+    cached_body = _page_cache.get(cache_key)
+    if cached_body is not None:
+        return Response(cached_body, media_type="application/json", headers=cache_headers)
+
+    # Build query with cursor-based pagination. Selecting the response
+    # columns instead of the mapped entity skips ORM instance
+    # construction — identity-map bookkeeping and attribute
+    # instrumentation buy nothing on a read-only listing. lambda_stmt
+    # caches the constructed/compiled form across requests, with the
+    # closed-over cursor and limit extracted as bind parameters, so
+    # repeat requests skip the per-call statement build and asyncpg can
+    # reuse one server-side prepared plan.
+    fetch = limit + 1  # one extra row tells us whether more pages exist
+    query = lambda_stmt(lambda: select(
+        GalleryImage.id,
+        GalleryImage.cloudinary_url,
+        GalleryImage.caption,
+        GalleryImage.display_order,
+    ).order_by(GalleryImage.display_order.asc(), GalleryImage.id.asc()))
+
+    if cursor is not None:
+        # Get images after the cursor
+        query += lambda s: s.where(GalleryImage.display_order > cursor)
+
+    query += lambda s: s.limit(fetch)
+    result = await db.execute(query)
+    images = result.mappings().all()
+
+    # Check if there are more results
+    has_more = len(images) > limit
+    if has_more:
+        images = images[:limit]  # Remove the extra record
+
+    # Determine next cursor
+    next_cursor = images[-1]["display_order"] if images and has_more else None
+
+    # %-style defers formatting to the logging framework, so nothing is
+    # built when INFO is disabled in production
+    logger.info(
+        "Retrieved %d gallery images (cursor: %s, next: %s, has_more: %s)",
+        len(images), cursor, next_cursor, has_more,
+    )
+
+    # The selected columns are exactly the response fields, so the row
+    # mappings become the payload directly — no intermediate Pydantic
+    # objects on this trusted read path. orjson serializes the whole page
+    # in one C-level pass, and returning a Response makes FastAPI skip
+    # jsonable_encoder and response_model revalidation. The response_model
+    # stays on the decorator purely for the OpenAPI docs.
+    body = orjson.dumps({
+        "images": [dict(row) for row in images],
+        "pagination": {
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+            "total_count": total_count
+        }
+    })
+
+    # Store under the current etag and drop pages of older versions; once
+    # the cap is reached, further distinct (limit, cursor) probes are
+    # served but not cached — real pagination uses a handful of cursors,
+    # so only garbage probes ever hit the cap
+    for key in [k for k in _page_cache if k[0] != etag]:
+        del _page_cache[key]
+    if len(_page_cache) < _PAGE_CACHE_MAX:
+        _page_cache[cache_key] = body
+
+    return Response(body, media_type="application/json", headers=cache_headers)
+
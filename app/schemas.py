@@ -20,10 +20,7 @@ class GalleryImageResponse(BaseModel):
     updated_at: datetime
 
     model_config = ConfigDict(
-        from_attributes=True,  # Enable conversion from SQLAlchemy models
-        json_encoders={
-            datetime: lambda v: v.isoformat()  # Format dates as ISO 8601 strings
-        }
+        from_attributes=True  # Enable conversion from SQLAlchemy models
     )
 
 
@@ -4,15 +4,20 @@ Provides functions for uploading images with automatic optimization and CDN deli
 """
 import cloudinary
 import cloudinary.uploader
+import cloudinary.api
 from cloudinary.exceptions import Error as CloudinaryError
 from app.config import settings
+import io
 import logging
 import asyncio
+import time
 from typing import Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
 
-# Configure Cloudinary with credentials from settings
+# Configure Cloudinary with credentials from settings. The SDK keeps a
+# module-level urllib3 PoolManager, so TCP/TLS connections are reused across
+# calls; the blocking calls themselves run in worker threads (see below).
 cloudinary.config(
     cloud_name=settings.CLOUDINARY_CLOUD_NAME,
     api_key=settings.CLOUDINARY_API_KEY,
@@ -21,6 +26,25 @@ cloudinary.config(
 )
 
 
+# Above this size, use Cloudinary's chunked upload so the body streams to
+# Cloudinary in parts instead of one buffered HTTP request
+_CHUNKED_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+_CHUNKED_UPLOAD_PART_SIZE = 5 * 1024 * 1024
+
+
+def _payload_size(file: Any) -> Optional[int]:
+    """Byte length of an upload source, or None when it can't be probed
+    cheaply (e.g. a filesystem path or remote URL)."""
+    if isinstance(file, (bytes, bytearray)):
+        return len(file)
+    if hasattr(file, 'seek') and hasattr(file, 'tell'):
+        file.seek(0, 2)
+        size = file.tell()
+        file.seek(0)
+        return size
+    return None
+
+
 async def upload_image(
     file: Any,
     folder: str = "gallery",
@@ -29,6 +53,7 @@ async def upload_image(
 ) -> Dict[str, Any]:
     """
     Upload image to Cloudinary with automatic optimization and retry logic.
+    Payloads larger than 5MB are sent via Cloudinary's chunked upload API.
 
     Args:
         file: File object, file path, or bytes to upload
@@ -49,30 +74,71 @@ async def upload_image(
         CloudinaryError: If upload fails after all retries
         Exception: For unexpected errors
     """
+    # Common upload options shared by both upload paths
+    upload_options = {
+        "folder": folder,
+        "public_id": public_id,
+        # Automatic optimization settings
+        "fetch_format": "auto",  # Auto-select best format (WebP, AVIF, etc.)
+        "quality": "auto",  # Automatic quality optimization and compression
+        # Transformation options
+        "transformation": [
+            {
+                "width": 1920,
+                "height": 1080,
+                "crop": "limit"  # Limit max dimensions, maintain aspect ratio
+            }
+        ]
+    }
+
+    # File objects (the spooled upload temp files) are the common source
+    # here, so probe their size too — a large already-WebP upload skips
+    # conversion and arrives as a file handle, and it still must stream in
+    # parts rather than buffer into one HTTP request
+    _size = _payload_size(file)
+    use_chunked = _size is not None and _size > _CHUNKED_UPLOAD_THRESHOLD
+
     for attempt in range(max_retries):
         try:
-            # Upload with automatic optimization
-            result = cloudinary.uploader.upload(
-                file,
-                folder=folder,
-                public_id=public_id,
-                # Automatic optimization settings
-                fetch_format="auto",  # Auto-select best format (WebP, AVIF, etc.)
-                quality="auto",  # Automatic quality optimization and compression
-                # Transformation options
-                transformation=[
-                    {
-                        "width": 1920,
-                        "height": 1080,
-                        "crop": "limit"  # Limit max dimensions, maintain aspect ratio
-                    }
-                ]
-            )
+            # File-like sources must be rewound per attempt; a failed
+            # attempt may have consumed part of the stream
+            if hasattr(file, 'seek'):
+                file.seek(0)
+
+            if use_chunked:
+                # Stream large payloads in parts. upload_large consumes its
+                # source, so bytes get a fresh buffer per attempt; file
+                # objects were already rewound above and stream directly
+                if isinstance(file, (bytes, bytearray)):
+                    chunk_source = io.BytesIO(file)
+                else:
+                    chunk_source = file
+                result = await asyncio.to_thread(
+                    cloudinary.uploader.upload_large,
+                    chunk_source,
+                    chunk_size=_CHUNKED_UPLOAD_PART_SIZE,
+                    **upload_options
+                )
+            else:
+                # Upload with automatic optimization
+                result = await asyncio.to_thread(
+                    cloudinary.uploader.upload, file, **upload_options
+                )
 
             logger.info(f"Successfully uploaded image: {result['public_id']}")
 
+            # Bake the delivery transformations into the stored URL at
+            # write time. Every read then ships a final CDN URL as a plain
+            # column value — no per-request URL building — and the browser
+            # negotiates format/quality via f_auto,q_auto on the CDN edge.
+            delivery_url = cloudinary.CloudinaryImage(result["public_id"]).build_url(
+                transformation=[{"fetch_format": "auto", "quality": "auto"}],
+                version=result.get("version"),
+                secure=True
+            )
+
             return {
-                "url": result["secure_url"],
+                "url": delivery_url,
                 "public_id": result["public_id"],
                 "format": result["format"],
                 "width": result["width"],
@@ -115,7 +181,8 @@ async def delete_image(public_id: str, max_retries: int = 3) -> Dict[str, Any]:
     for attempt in range(max_retries):
         try:
             # Delete with CDN invalidation to ensure asset is removed from cache
-            result = cloudinary.uploader.destroy(
+            result = await asyncio.to_thread(
+                cloudinary.uploader.destroy,
                 public_id,
                 invalidate=True,  # Invalidate CDN cache
                 resource_type='image'  # Explicitly specify resource type
@@ -146,6 +213,56 @@ async def delete_image(public_id: str, max_retries: int = 3) -> Dict[str, Any]:
             raise
 
 
+# Cloudinary's Admin API accepts at most this many public_ids per call
+BULK_DELETE_BATCH_SIZE = 100
+
+
+async def bulk_delete_images(public_ids: list, max_retries: int = 3) -> Dict[str, Any]:
+    """
+    Delete multiple images from Cloudinary in a single Admin API call.
+    One HTTPS round-trip handles up to 100 public_ids, instead of one
+    request per image.
+
+    Args:
+        public_ids: Cloudinary public IDs to delete (at most 100 per call)
+        max_retries: Maximum number of retry attempts for transient failures
+
+    Returns:
+        dict: Deletion result from Cloudinary mapping public_id to status
+
+    Raises:
+        CloudinaryError: If deletion fails after all retries
+        Exception: For unexpected errors
+    """
+    for attempt in range(max_retries):
+        try:
+            result = await asyncio.to_thread(
+                cloudinary.api.delete_resources,
+                public_ids,
+                invalidate=True,  # Invalidate CDN cache
+                resource_type='image'
+            )
+
+            logger.info(f"Bulk deleted {len(public_ids)} image(s) from Cloudinary: {result.get('deleted')}")
+            return result
+
+        except CloudinaryError as e:
+            logger.warning(f"Cloudinary bulk delete error (attempt {attempt + 1}/{max_retries}): {str(e)}")
+
+            # Retry with exponential backoff for transient failures
+            if attempt < max_retries - 1:
+                await asyncio.sleep(2 ** attempt)  # 1s, 2s, 4s backoff
+                continue
+
+            # All retries exhausted
+            logger.error(f"Cloudinary bulk delete failed after {max_retries} attempts: {str(e)}")
+            raise
+
+        except Exception as e:
+            logger.error(f"Unexpected error during bulk image deletion: {str(e)}", exc_info=True)
+            raise
+
+
 def get_optimized_url(
     public_id: str,
     width: Optional[int] = None,
@@ -190,22 +307,39 @@ def get_optimized_url(
     return url
 
 
+# Cached result of the last config validation. Credentials only change on
+# deploy, so health checks polling this don't need to re-validate every hit;
+# a short TTL still picks up config rotation without a restart.
+_CONFIG_CHECK_TTL = 60.0
+_config_check: Optional[tuple] = None  # (result, monotonic timestamp)
+
+
 def validate_cloudinary_config() -> bool:
     """
     Validate that Cloudinary is properly configured.
+    The result is cached for a short TTL to keep repeated health checks cheap.
 
     Returns:
         bool: True if Cloudinary is configured, False otherwise
     """
+    global _config_check
+
+    now = time.monotonic()
+    if _config_check is not None and now - _config_check[1] < _CONFIG_CHECK_TTL:
+        return _config_check[0]
+
     if not settings.CLOUDINARY_CLOUD_NAME:
         logger.warning("CLOUDINARY_CLOUD_NAME not configured")
-        return False
-    if not settings.CLOUDINARY_API_KEY:
+        result = False
+    elif not settings.CLOUDINARY_API_KEY:
         logger.warning("CLOUDINARY_API_KEY not configured")
-        return False
-    if not settings.CLOUDINARY_API_SECRET:
+        result = False
+    elif not settings.CLOUDINARY_API_SECRET:
         logger.warning("CLOUDINARY_API_SECRET not configured")
-        return False
+        result = False
+    else:
+        logger.info("Cloudinary configuration validated successfully")
+        result = True
 
-    logger.info("Cloudinary configuration validated successfully")
-    return True
+    _config_check = (result, now)
+    return result
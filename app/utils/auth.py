@@ -3,9 +3,20 @@ Password authentication utilities for CMS access.
 Uses bcrypt for secure password hashing.
 """
 import bcrypt
+import hashlib
+import hmac
+import time
 from app.config import settings
 from fastapi import HTTPException, status
 
+# sha256 digests of recently accepted passwords (never the plaintext),
+# tagged with a monotonic expiry. bcrypt costs ~100ms of CPU per check;
+# repeat requests with the same header skip the KDF for the TTL window.
+# Lookups use hmac.compare_digest so the fast path stays constant-time.
+# Rejected passwords are never cached — failures always pay full bcrypt.
+_ACCEPTED_TTL = 300.0
+_accepted_digests: dict = {}  # digest -> monotonic expiry
+
 
 def hash_password(password: str) -> str:
     """
@@ -58,6 +69,31 @@ def verify_admin_password(password: str) -> bool:
     """
     if not settings.ADMIN_PASSWORD_HASH:
         raise ValueError("ADMIN_PASSWORD_HASH not configured")
-    
-    return verify_password(password, settings.ADMIN_PASSWORD_HASH)
+
+    digest = hashlib.sha256(password.encode('utf-8')).digest()
+    now = time.monotonic()
+
+    # This runs in worker threads (asyncio.to_thread), so concurrent
+    # requests can mutate the cache mid-check. Iterate over an atomic
+    # snapshot — never the live dict — and pop() deletions so a key
+    # removed by another thread is a no-op rather than a KeyError.
+    entries = list(_accepted_digests.items())
+
+    # Prune expired entries lazily; the cache only ever holds accepted
+    # digests, so it stays tiny
+    for key, expires in entries:
+        if expires <= now:
+            _accepted_digests.pop(key, None)
+
+    if any(
+        hmac.compare_digest(digest, key)
+        for key, expires in entries
+        if expires > now
+    ):
+        return True
+
+    result = verify_password(password, settings.ADMIN_PASSWORD_HASH)
+    if result:
+        _accepted_digests[digest] = now + _ACCEPTED_TTL
+    return result
 
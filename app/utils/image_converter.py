@@ -2,13 +2,28 @@
 Image conversion utility for converting images to WebP format.
 Reduces file size before uploading to Cloudinary.
 """
+import asyncio
 import io
 import logging
-from typing import Optional, Tuple
-from PIL import Image, UnidentifiedImageError
+from typing import BinaryIO, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Pillow is imported lazily on first use. It is one of the heavier imports in
+# the dependency stack, and paying for it on every serverless cold start
+# penalizes requests that never touch image conversion.
+Image = None
+UnidentifiedImageError = None
+
+
+def _load_pillow():
+    """Import Pillow on first use and bind the module-level names."""
+    global Image, UnidentifiedImageError
+    if Image is None:
+        from PIL import Image as _Image, UnidentifiedImageError as _UnidentifiedImageError
+        Image = _Image
+        UnidentifiedImageError = _UnidentifiedImageError
+
 # WebP conversion settings
 DEFAULT_WEBP_QUALITY = 85  # Balance between quality and file size (0-100)
 DEFAULT_WEBP_METHOD = 6    # Compression method (0-6, higher = better compression but slower)
@@ -16,39 +31,71 @@ MAX_DIMENSION = 3840       # Maximum width or height before downscaling (optiona
 
 
 async def convert_to_webp(
-    image_bytes: bytes,
+    image_source: Union[bytes, BinaryIO],
     quality: int = DEFAULT_WEBP_QUALITY,
     method: int = DEFAULT_WEBP_METHOD,
     max_dimension: Optional[int] = MAX_DIMENSION,
     skip_if_webp: bool = True
-) -> Tuple[bytes, bool]:
+) -> Tuple[Union[bytes, BinaryIO], bool]:
     """
-    Convert image bytes to WebP format to reduce file size.
+    Convert an image to WebP format to reduce file size.
+    Accepts raw bytes or a seekable binary file object (e.g. an upload's
+    spooled temp file) — Pillow streams from file objects directly, so
+    large images are never materialized as an extra bytes copy.
     
     Args:
-        image_bytes: Original image file bytes
+        image_source: Original image bytes or seekable binary file object
         quality: WebP quality (0-100, default: 85)
         method: WebP compression method (0-6, default: 6)
         max_dimension: Maximum width or height before downscaling (None to disable)
-        skip_if_webp: If True, return original bytes if already WebP format
+        skip_if_webp: If True, return the original source if already WebP format
     
     Returns:
-        Tuple[bytes, bool]: 
-            - Converted image bytes (or original if skipped/failed)
+        Tuple[Union[bytes, BinaryIO], bool]: 
+            - Converted image bytes (or the original source if skipped/failed;
+              file objects are rewound to the start before being returned)
             - Whether conversion was successful/skipped (True) or failed (False)
     
     Raises:
         UnidentifiedImageError: If image format cannot be identified
         Exception: For other image processing errors
     """
+    # Pillow decode+encode is CPU-bound; run it in a worker thread so
+    # concurrent uploads are not serialized on the event loop
+    return await asyncio.to_thread(
+        _convert_to_webp_sync, image_source, quality, method, max_dimension, skip_if_webp
+    )
+
+
+def _convert_to_webp_sync(
+    image_source: Union[bytes, BinaryIO],
+    quality: int,
+    method: int,
+    max_dimension: Optional[int],
+    skip_if_webp: bool
+) -> Tuple[Union[bytes, BinaryIO], bool]:
+    """Synchronous worker for convert_to_webp; see its docstring."""
+    _load_pillow()
+
+    is_bytes = isinstance(image_source, (bytes, bytearray))
+
     try:
-        # Open image from bytes
-        image = Image.open(io.BytesIO(image_bytes))
+        # Open the image; Pillow reads lazily from file objects
+        if is_bytes:
+            original_size = len(image_source)
+            image = Image.open(io.BytesIO(image_source))
+        else:
+            image_source.seek(0, io.SEEK_END)
+            original_size = image_source.tell()
+            image_source.seek(0)
+            image = Image.open(image_source)
         
         # Check if already WebP format
         if skip_if_webp and image.format == 'WEBP':
             logger.debug("Image is already WebP format, skipping conversion")
-            return image_bytes, True
+            if not is_bytes:
+                image_source.seek(0)
+            return image_source, True
         
         # Handle RGBA mode (for PNG with transparency)
         # WebP supports transparency, so preserve alpha channel
@@ -104,7 +151,6 @@ async def convert_to_webp(
         image.save(webp_buffer, **save_kwargs)
         webp_bytes = webp_buffer.getvalue()
         
-        original_size = len(image_bytes)
         converted_size = len(webp_bytes)
         reduction = ((original_size - converted_size) / original_size) * 100
         
@@ -118,11 +164,15 @@ async def convert_to_webp(
         
     except UnidentifiedImageError as e:
         logger.warning(f"Cannot identify image format: {str(e)}")
-        return image_bytes, False
+        if not is_bytes:
+            image_source.seek(0)
+        return image_source, False
     
     except Exception as e:
         logger.error(f"Error converting image to WebP: {str(e)}", exc_info=True)
-        return image_bytes, False
+        if not is_bytes:
+            image_source.seek(0)
+        return image_source, False
 
 
 def is_webp_format(image_bytes: bytes) -> bool:
@@ -135,6 +185,8 @@ def is_webp_format(image_bytes: bytes) -> bool:
     Returns:
         bool: True if image is WebP format, False otherwise
     """
+    _load_pillow()
+
     try:
         image = Image.open(io.BytesIO(image_bytes))
         return image.format == 'WEBP'
@@ -152,6 +204,8 @@ def get_image_info(image_bytes: bytes) -> Optional[dict]:
     Returns:
         dict: Image information (format, size, mode) or None if error
     """
+    _load_pillow()
+
     try:
         image = Image.open(io.BytesIO(image_bytes))
         return {